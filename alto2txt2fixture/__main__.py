@@ -33,6 +33,7 @@ from argparse import (
     Namespace,
     RawTextHelpFormatter,
 )
+from functools import lru_cache
 
 from .cli import show_fixture_tables, show_setup
 from .parser import parse
@@ -41,22 +42,14 @@ from .settings import DATA_PROVIDER_INDEX, settings
 from .utils import clear_cache, export_fixtures
 
 
-def parse_args(argv: list[str] | None = None) -> Namespace:
-    """Manage command line arguments for `run()`
-
-    This constructs an `ArgumentParser` instance to manage
-    configurating calls of `run()` to manage `newspaper`
-    `XML` to `JSON` converstion.
+@lru_cache(maxsize=1)
+def _build_parser() -> ArgumentParser:
+    """Construct the `ArgumentParser` used by `parse_args`.
 
-    Arguments:
-        argv:
-            If `None` treat as equivalent of ['--help`],
-            if a `list` of `str` pass those options to `ArgumentParser`
-
-    Returns:
-        A `Namespace` `dict`-like configuration for `run()`
+    Note:
+        This is cached as `ArgumentParser.parse_args` does not modify the
+        `parser`, so repeated `run()` calls can reuse one instance.
     """
-    argv = None if not argv else argv
     parser = ArgumentParser(
         prog="a2t2f-news",
         description="Process alto2txt XML into and Django JSON Fixture files",
@@ -112,7 +105,26 @@ def parse_args(argv: list[str] | None = None) -> Namespace:
         default=DATA_PROVIDER_INDEX,
         help="Key for indexing DataProvider records",
     )
-    return parser.parse_args(argv)
+    return parser
+
+
+def parse_args(argv: list[str] | None = None) -> Namespace:
+    """Manage command line arguments for `run()`
+
+    This uses an `ArgumentParser` instance from `_build_parser` to manage
+    configurating calls of `run()` to manage `newspaper`
+    `XML` to `JSON` converstion.
+
+    Arguments:
+        argv:
+            If `None` treat as equivalent of ['--help`],
+            if a `list` of `str` pass those options to `ArgumentParser`
+
+    Returns:
+        A `Namespace` `dict`-like configuration for `run()`
+    """
+    argv = None if not argv else argv
+    return _build_parser().parse_args(argv)
 
 
 def run(local_args: list[str] | None = None) -> None:
@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Any, Callable, Final, get_args, get_type_hints
 
 import typer
+from rich.console import Console
 from rich.prompt import Confirm, Prompt
 from rich.table import Table
 from typing_extensions import Annotated
@@ -219,8 +220,20 @@ def rename(
                 Path(new_path).unlink()
 
 
-def show_setup(clear: bool = True, title: str = SETUP_TITLE, **kwargs) -> None:
-    """Generate a `rich.table.Table` for printing configuration to console."""
+def show_setup(
+    clear: bool = True,
+    title: str = SETUP_TITLE,
+    console: Console = console,
+    **kwargs,
+) -> None:
+    """Generate a `rich.table.Table` for printing configuration to console.
+
+    Arguments:
+        clear: whether to clear the terminal prior to printing
+        title: title of the printed `rich.table.Table`
+        console: `Console` to print to, defaults to the package `console`
+        **kwargs: `Setting` names and `Value`s to print as rows
+    """
     if clear and os.name == "posix":
         os.system("clear")
     elif clear:
@@ -242,6 +255,7 @@ def show_fixture_tables(
     run_settings: dotdict = settings,
     print_in_call: bool = True,
     data_provider_index: str = DATA_PROVIDER_INDEX,
+    console: Console = console,
 ) -> list[Table]:
     """Print fixture tables specified in ``settings.fixture_tables`` in `rich.Table` format.
 
@@ -249,6 +263,7 @@ def show_fixture_tables(
         run_settings: `alto2txt2fixture` run configuration
         print_in_call: whether to print to console (will use ``console`` variable if so)
         data_provider_index: key to index `dataprovider` from ``NEWSPAPER_COLLECTION_METADATA``
+        console: `Console` to print to if ``print_in_call``
 
     Returns:
         A `list` of `rich.Table` renders from configurations in ``run_settings.FIXTURE_TABLES``
@@ -1,4 +1,5 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from os import PathLike
 from pathlib import Path
@@ -9,15 +10,17 @@ from urllib.request import urlopen
 import numpy as np
 import pandas as pd
 from rich import print
-from rich.progress import BarColumn, DownloadColumn, Progress
+from rich.progress import BarColumn, DownloadColumn, Progress, TaskID
 
 from .settings import JSON_INDENT
-from .utils import get_now, logger
+from .utils import get_now, logger, write_jsonl
 
 OUTPUT: Final[Path] = Path("output/tables")
+COMBINED_JSONL_FILENAME: Final[str] = "combined.jsonl"
 TIME_FORMAT: Final[str] = "%Y-%m-%d %H:%M:%S.%f+00:00"
 # NOW: Final[str] = datetime.now().strftime()
 OVERWRITE: Final[bool] = False
+DOWNLOAD_MAX_WORKERS: Final[int] = 4
 
 LOCAL_CACHE: Final[Path] = Path("cache")
 
@@ -96,6 +99,10 @@ MITCHELLS_OUT_FILENAMES: TableOutputConfigType = get_outpaths_dict(
 GAZETTEER_OUT_FILENAMES: TableOutputConfigType = get_outpaths_dict(
     GAZETTEER_TABLES, "gazetteer"
 )
+assert not set(MITCHELLS_OUT_FILENAMES) & set(GAZETTEER_OUT_FILENAMES)
+ALL_OUT_FILENAMES: TableOutputConfigType = (
+    MITCHELLS_OUT_FILENAMES | GAZETTEER_OUT_FILENAMES
+)
 
 
 class RemoteDataSourceType(TypedDict, total=False):
@@ -160,7 +167,6 @@ def csv2json_list(
         https://stackoverflow.com/a/62691803/678486
 
     """
-    json_data: list[dict[str, Any]] = []
     df: pd.DataFame = (
         pd.read_csv(csv_path, index_col=0).fillna(np.nan).replace([np.nan], [None])
     )
@@ -172,9 +178,10 @@ def csv2json_list(
 
     model: str = Path(csv_path).stem.lower()
 
-    for pk, row in df.iterrows():
-        fields: dict[str, Any] = row.to_dict()
-        json_data.append({"pk": pk, "model": model, "fields": fields})
+    json_data: list[dict[str, Any]] = [
+        {"pk": pk, "model": model, "fields": fields}
+        for pk, fields in zip(df.index.tolist(), df.to_dict(orient="records"))
+    ]
 
     json_path: Path = Path(output_path) / f"{Path(csv_path).stem}.json"
     json_path.parent.mkdir(parents=True, exist_ok=True)
@@ -238,24 +245,27 @@ def download_data(
         overwrite: `bool` to overwrite ``LOCAL_CACHE`` files or not
         exclude: `list` of files to exclude from ``files_dict``
 
+    Note:
+        Up to ``DOWNLOAD_MAX_WORKERS`` files are downloaded concurrently.
+
     Example:
         ```pycon
-        >>> from os import chdir
-        >>> tmp_path: Path = getfixture('tmp_path')
-        >>> set_path: Path = chdir(tmp_path)
+        >>> if not getfixture('pytestconfig').getoption('--rundownload'):
+        ...     pytest.skip('need --rundownload option to run')
+        >>> tmp_path: Path = getfixture('uncached_folder')
         >>> download_data(exclude=["mitchells", "Newspaper-1", "linking"])
         Excluding mitchells...
         Excluding Newspaper-1...
         Excluding linking...
         Downloading cache...dict_admin_counties.json
-        100% ... 37/37 bytes
         Downloading cache...dict_countries.json
-        100% ... 33.2/33.2 kB
         Downloading cache...dict_historic_counties.json
-        100% ... 41.4/41.4 kB
         Downloading cache...nlp_loc_wikidata_concat.csv
-        100% ... 59.8/59.8 kB
         Downloading cache...wikidata_gazetteer_selected_columns.csv
+        100% ... 37/37 bytes
+        100% ... 33.2/33.2 kB
+        100% ... 41.4/41.4 kB
+        100% ... 59.8/59.8 kB
         100% ... 47.8/47.8 MB
 
         ```
@@ -280,22 +290,40 @@ def download_data(
         for v in files_dict.values()
         if "exists" in v and not v["exists"] or overwrite
     ]
-    for url, out, exists in files_to_download:
+    for _, out, exists in files_to_download:
         rmtree(Path(out), ignore_errors=True) if exists else None
         print(f"Downloading {out}")
         Path(out).parent.mkdir(parents=True, exist_ok=True)
-        assert isinstance(url, str)
-        with urlopen(url) as response, open(out, "wb") as out_file:
-            total: int = int(response.info()["Content-length"])
-            with Progress(
-                "[progress.percentage]{task.percentage:>3.0f}%",
-                BarColumn(),  # removed bar_width=None to avoid too long when resized
-                DownloadColumn(),
-            ) as progress:
-                download_task = progress.add_task("Download", total=total)
-                for chunk in response:
-                    out_file.write(chunk)
-                    progress.update(download_task, advance=len(chunk))
+    if not files_to_download:
+        return
+    with Progress(
+        "[progress.percentage]{task.percentage:>3.0f}%",
+        BarColumn(),  # removed bar_width=None to avoid too long when resized
+        DownloadColumn(),
+    ) as progress, ThreadPoolExecutor(
+        max_workers=min(DOWNLOAD_MAX_WORKERS, len(files_to_download))
+    ) as executor:
+        # Add tasks in order so progress rows match `files_to_download`
+        download_tasks: list[TaskID] = [
+            progress.add_task("Download", total=None) for _ in files_to_download
+        ]
+        for future in [
+            executor.submit(_download_file, url, out, progress, download_task)
+            for (url, out, _), download_task in zip(files_to_download, download_tasks)
+        ]:
+            future.result()
+
+
+def _download_file(
+    url: str, out: PathLike, progress: Progress, download_task: TaskID
+) -> None:
+    """Stream ``url`` to ``out``, updating ``download_task`` in ``progress``."""
+    assert isinstance(url, str)
+    with urlopen(url) as response, open(out, "wb") as out_file:
+        progress.update(download_task, total=int(response.info()["Content-length"]))
+        for chunk in response:
+            out_file.write(chunk)
+            progress.update(download_task, advance=len(chunk))
 
 
 def run(
@@ -351,12 +379,14 @@ def run(
 
     # Read in + fix all dictionaries
     dict_historic_counties = json.loads(
-        Path(files_dict["dict_historic_counties"]["local"]).read_text()
+        Path(files_dict["dict_historic_counties"]["local"]).read_bytes()
     )
     dict_admin_counties = json.loads(
-        Path(files_dict["dict_admin_counties"]["local"]).read_text()
+        Path(files_dict["dict_admin_counties"]["local"]).read_bytes()
+    )
+    dict_countries = json.loads(
+        Path(files_dict["dict_countries"]["local"]).read_bytes()
     )
-    dict_countries = json.loads(Path(files_dict["dict_countries"]["local"]).read_text())
     dict_historic_counties = correct_dict(dict_historic_counties)
     dict_admin_counties = correct_dict(dict_admin_counties)
     dict_countries = correct_dict(dict_countries)
@@ -737,7 +767,7 @@ def run(
     entry_table.drop(columns=["place_of_publication_id"], inplace=True)
 
     # Set up ref to newspapers
-    rev = json.loads(files_dict["Newspaper-1"]["local"].read_text())
+    rev = json.loads(Path(files_dict["Newspaper-1"]["local"]).read_bytes())
     rev = [dict(pk=v["pk"], **v["fields"]) for v in rev]
     rev = pd.DataFrame(rev)
     rev.set_index("publication_code", inplace=True)
@@ -763,8 +793,15 @@ def run(
     saved.append(output_path / MITCHELLS_OUT_FILENAMES[ENTRY]["csv"])
 
     # ###### NOW WE CAN EASILY CREATE JSON files_dict
-    for csv_file_path in output_path.glob("*.csv"):
+    # Sorted to match `load_multiple_json` ordering of the `json` files
+    json_lists: list[list] = [
         csv2json_list(csv_file_path, output_path=output_path)
+        for csv_file_path in sorted(output_path.glob("*.csv"))
+    ]
+
+    # Combine all `json` results in one file for faster loading
+    write_jsonl(output_path / COMBINED_JSONL_FILENAME, json_lists)
+    saved.append(output_path / COMBINED_JSONL_FILENAME)
 
     print("Finished - saved files:")
     print("- " + "\n- ".join([str(x) for x in saved]))
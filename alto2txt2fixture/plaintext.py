@@ -647,7 +647,7 @@ class PlainTextFixture:
             (...Path(...plaintext_fixture-000001.json...),)
             >>> import json
             >>> exported_json = json.loads(
-            ...     plaintext_bl_lwm._exported_json_paths[0].read_text()
+            ...     plaintext_bl_lwm._exported_json_paths[0].read_bytes()
             ... )
             >>> exported_json[0]['pk'] == first_lwm_plaintext_json_dict['pk']
             True
@@ -701,8 +701,6 @@ class PlainTextFixture:
             >>> if is_platform_win:
             ...     pytest.skip('decompression fails on Windows: issue #55')
             >>> plaintext_bl_lwm = getfixture('bl_lwm_plaintext_json_export')
-            <BLANKLINE>
-            ...
             >>> tuple(plaintext_bl_lwm.exported_json_paths)
             (...Path('...plaintext_fixture-000001.json'),)
 
@@ -742,8 +740,6 @@ class PlainTextFixture:
             ...     pytest.skip('decompression fails on Windows: issue #55')
             >>> tmp_path = getfixture('tmp_path')
             >>> plaintext_bl_lwm = getfixture('bl_lwm_plaintext_json_export')
-            <BLANKLINE>
-            ...
             >>> tuple(plaintext_bl_lwm.exported_json_paths)
             (...Path('...plaintext_fixture-000001.json'),)
             >>> plaintext_bl_lwm.set_exported_json_paths(tmp_path, 'check-prefix')
@@ -808,8 +804,6 @@ class PlainTextFixture:
             >>> if is_platform_win:
             ...     pytest.skip('decompression fails on Windows: issue #55')
             >>> plaintext_bl_lwm = getfixture('bl_lwm_plaintext_json_export')
-            <BLANKLINE>
-            ...
             >>> compressed_paths: Path = plaintext_bl_lwm.compress_json_exports(
             ...     format='tar')
             <BLANKLINE>
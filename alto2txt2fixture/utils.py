@@ -4,6 +4,7 @@ import json
 import logging
 from collections import OrderedDict
 from enum import StrEnum
+from functools import lru_cache
 from os import PathLike, chdir, getcwd, sep
 from os.path import normpath
 from pathlib import Path, PureWindowsPath
@@ -414,11 +415,12 @@ def load_json(p: str | Path, crash: bool = False) -> dict | list:
     """
 
     p = get_path_from(p)
+    content: bytes = p.read_bytes()
 
     try:
-        return json.loads(p.read_text())
+        return json.loads(content)
     except json.JSONDecodeError:
-        msg = f"Error: {p.read_text()}"
+        msg = f"Error: {content.decode(errors='replace')}"
         error(msg, crash=crash)
 
     return {}
@@ -451,9 +453,11 @@ def list_json_files(
     files = get_path_from(p).glob(q)
 
     if exclude_names:
-        files = list({x for x in files if x.name not in exclude_names})
+        excluded: frozenset[str] = frozenset(exclude_names)
+        files = [x for x in files if x.name not in excluded]
     elif include_names:
-        files = list({x for x in files if x.name in include_names})
+        included: frozenset[str] = frozenset(include_names)
+        files = [x for x in files if x.name in included]
 
     return sorted(files)
 
@@ -463,6 +467,7 @@ def load_multiple_json(
     drill: bool = False,
     filter_na: bool = True,
     crash: bool = False,
+    jsonl_name: str | None = None,
 ) -> list:
     """
     Load multiple `json` files and return a list of their content.
@@ -475,10 +480,30 @@ def load_multiple_json(
             is `None`. Default is `True`.
         crash: A flag indicating whether to raise an exception when an
             error occurs while loading a `json` file. Default is `False`.
+        jsonl_name: Name of a `jsonl` file within `p` combining all `json`
+            files, one per line. If present it is loaded via `load_jsonl`
+            instead of opening each `json` file.
 
     Returns:
         A `list` of the content of the loaded `json` files.
+
+    Example:
+        ```pycon
+        >>> tmp_path: Path = getfixture('tmp_path')
+        >>> write_json(tmp_path / 'a.json', [{'pk': 1}], add_created=False)
+        >>> write_json(tmp_path / 'b.json', [{'pk': 2}], add_created=False)
+        >>> load_multiple_json(tmp_path)
+        [[{'pk': 1}], [{'pk': 2}]]
+        >>> write_jsonl(tmp_path / 'combined.jsonl', [[{'pk': 3}]])
+        >>> load_multiple_json(tmp_path, jsonl_name='combined.jsonl')
+        [[{'pk': 3}]]
+
+        ```
     """
+    if jsonl_name and (get_path_from(p) / jsonl_name).is_file():
+        return load_jsonl(
+            get_path_from(p) / jsonl_name, filter_na=filter_na, crash=crash
+        )
 
     files = list_json_files(p, drill=drill)
 
@@ -487,6 +512,70 @@ def load_multiple_json(
     return [x for x in content if x] if filter_na else content
 
 
+def write_jsonl(p: str | Path, objs: Iterable[dict | list]) -> None:
+    """Write each of `objs` as a `json` line to `p`, creating parents if needed.
+
+    Args:
+        p: Path to write `jsonl` to
+        objs: `dict` or `list` objects to write, one per line
+
+    Example:
+        ```pycon
+        >>> tmp_path: Path = getfixture('tmp_path')
+        >>> path: Path = tmp_path / 'test-write-jsonl-example.jsonl'
+        >>> write_jsonl(path, [[{'pk': 1}], [{'pk': 2}, {'pk': 3}]])
+        >>> print(path.read_text())
+        [{"pk": 1}]
+        [{"pk": 2}, {"pk": 3}]
+        <BLANKLINE>
+
+        ```
+    """
+    p = get_path_from(p)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    with p.open("w") as jsonl_file:
+        for obj in objs:
+            jsonl_file.write(json.dumps(obj) + "\n")
+
+
+def load_jsonl(p: str | Path, filter_na: bool = True, crash: bool = False) -> list:
+    """Load each line of a `jsonl` file via a single open file handle.
+
+    Args:
+        p: Path to read `jsonl` from
+        filter_na: Whether to filter out empty lines and empty results.
+        crash: Whether the program should crash if there is a `json` decode
+            error, default: ``False``
+
+    Returns:
+        A `list` of the decoded content of each line of ``p``. Lines that
+        cannot be decoded are skipped if ``crash`` is ``False``.
+
+    Example:
+        ```pycon
+        >>> tmp_path: Path = getfixture('tmp_path')
+        >>> path: Path = tmp_path / 'test-load-jsonl-example.jsonl'
+        >>> write_jsonl(path, [[{'pk': 1}], [], [{'pk': 2}]])
+        >>> load_jsonl(path)
+        [[{'pk': 1}], [{'pk': 2}]]
+        >>> load_jsonl(path, filter_na=False)
+        [[{'pk': 1}], [], [{'pk': 2}]]
+
+        ```
+    """
+    p = get_path_from(p)
+    content: list = []
+    with p.open("rb") as jsonl_file:
+        for line in jsonl_file:
+            if not line.strip():
+                continue
+            try:
+                content.append(json.loads(line))
+            except json.JSONDecodeError:
+                error(f"Error: {line!r} in {p}", crash=crash)
+    return [x for x in content if x] if filter_na else content
+
+
 def filter_json_fields(
     json_results: list | dict | None = None,
     file_path: PathLike | None = None,
@@ -683,12 +772,11 @@ def check_newspaper_collection_configuration(
             ensure correctness irrespective of order in the example above.
 
     """
-    newspaper_collection_names: tuple[str, ...] = tuple(
+    collection_diff: set[str] = set(collections).difference(
         dict_from_list_fixture_fields(
             newspaper_collections, field_name=data_provider_index
-        ).keys()
+        )
     )
-    collection_diff: set[str] = set(collections) - set(newspaper_collection_names)
     if collection_diff:
         warning(
             f"{len(collection_diff)} `collections` "
@@ -971,15 +1059,16 @@ def export_fixtures(
         >>> test_fixture_tables: dict[str, FixtureDict] = {
         ...     'test0': NEWSPAPER_COLLECTION_METADATA,
         ...     'test1': NEWSPAPER_COLLECTION_METADATA}
-        >>> export_fixtures(test_fixture_tables, path='tests/')
+        >>> tmp_path: Path = getfixture('uncached_folder')
+        >>> export_fixtures(test_fixture_tables, path=tmp_path)
         <BLANKLINE>
         ...Warning: Saving test0...
         ...Warning: Saving test1...
         >>> from pandas import read_csv
-        >>> fixture0_json = load_json('tests/test-test0-000001.json')
-        >>> fixture0_df = read_csv('tests/test-test0-000001.csv')
-        >>> fixture1_json = load_json('tests/test-test1-000001.json')
-        >>> fixture1_df = read_csv('tests/test-test1-000001.csv')
+        >>> fixture0_json = load_json(tmp_path / 'test-test0-000001.json')
+        >>> fixture0_df = read_csv(tmp_path / 'test-test0-000001.csv')
+        >>> fixture1_json = load_json(tmp_path / 'test-test1-000001.json')
+        >>> fixture1_df = read_csv(tmp_path / 'test-test1-000001.csv')
         >>> fixture0_json == fixture1_json
         True
         >>> all(fixture0_df == fixture1_df)
@@ -1143,8 +1232,6 @@ def compress_fixture(
     Example:
         ```pycon
         >>> plaintext_bl_lwm = getfixture('bl_lwm_plaintext_json_export')
-        <BLANKLINE>
-        ...
         >>> tmp_path = getfixture('tmp_path')
         >>> json_path: Path = next(plaintext_bl_lwm.exported_json_paths)
         >>> assert 'pytest-of' in str(json_path)
@@ -1174,7 +1261,7 @@ def compress_fixture(
         ```
     """
     path = Path(path)
-    current_dir: Path = Path()
+    current_dir: Path = Path.cwd()
     root_dir: str | None = None
     base_dir: str | None = None
     if not path.exists():
@@ -1354,20 +1441,53 @@ def truncate_path_str(
                 f"not valid to truncate: '{path}'"
             )
             return str(path)
-        tail_index: int = len(original_path_parts) - tail_parts
-        replaced_path_parts: tuple[str, ...] = tuple(
-            part if (i < head_parts or i >= tail_index) else folder_filler_str
-            for i, part in enumerate(original_path_parts)
-        )
-        replaced_start_str: str = "".join(replaced_path_parts[:head_parts])
-        replaced_end_str: str = path_sep.join(
-            path for path in replaced_path_parts[head_parts:]
+        return _truncate_path_parts(
+            original_path_parts,
+            head_parts=head_parts,
+            tail_parts=tail_parts,
+            folder_filler_str=folder_filler_str,
+            path_sep=path_sep,
         )
-        return path_sep.join((replaced_start_str, replaced_end_str))
     else:
         return str(path)
 
 
+@lru_cache(maxsize=512)
+def _truncate_path_parts(
+    path_parts: tuple[str, ...],
+    head_parts: int,
+    tail_parts: int,
+    folder_filler_str: str,
+    path_sep: str,
+) -> str:
+    """Join `path_parts` replacing those between head and tail parts.
+
+    Note:
+        This is the logging-free part of `truncate_path_str`, cached as
+        all params are immutable and hashable. Parameter checks and logs
+        are managed by `truncate_path_str` for each call.
+
+    Example:
+        ```pycon
+        >>> _truncate_path_parts(('Standing', 'in', 'the', 'shadows'),
+        ...                      head_parts=1, tail_parts=1,
+        ...                      folder_filler_str='*', path_sep='/')
+        'Standing/*/*/shadows'
+
+        ```
+    """
+    tail_index: int = len(path_parts) - tail_parts
+    replaced_path_parts: tuple[str, ...] = tuple(
+        part if (i < head_parts or i >= tail_index) else folder_filler_str
+        for i, part in enumerate(path_parts)
+    )
+    replaced_start_str: str = "".join(replaced_path_parts[:head_parts])
+    replaced_end_str: str = path_sep.join(
+        path for path in replaced_path_parts[head_parts:]
+    )
+    return path_sep.join((replaced_start_str, replaced_end_str))
+
+
 def int_from_str(
     s: str,
     index: int = -1,
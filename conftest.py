@@ -1,16 +1,37 @@
 import json
 import sys
+from contextlib import chdir, redirect_stdout
+from copy import deepcopy
+from functools import lru_cache, partial
+from hashlib import sha256
+from io import StringIO
 from logging import DEBUG, INFO, WARNING
 from os import PathLike
 from pathlib import Path, PureWindowsPath
 from pprint import pprint
-from shutil import copytree, rmtree
-from typing import Final, Generator
+from shutil import copytree
+from socket import create_connection
+from typing import Callable, Final, Generator
+from urllib.parse import urlparse
 
 import pytest
+from click import Command
+from click.testing import CliRunner
 from coverage_badge.__main__ import main as gen_cov_badge
-
-from alto2txt2fixture.create_adjacent_tables import OUTPUT, run
+from filelock import FileLock
+from typer.main import get_command
+
+from alto2txt2fixture import create_adjacent_tables
+from alto2txt2fixture.cli import cli
+from alto2txt2fixture.create_adjacent_tables import (
+    ALL_OUT_FILENAMES,
+    COMBINED_JSONL_FILENAME,
+    FILES,
+    RemoteDataFilesType,
+    RemoteDataSourceType,
+    download_data,
+    run,
+)
 from alto2txt2fixture.plaintext import (
     DEFAULT_INITIAL_PK,
     FULLTEXT_DJANGO_MODEL,
@@ -18,11 +39,26 @@ from alto2txt2fixture.plaintext import (
     PlaintextFixtureDict,
     PlaintextFixtureFieldsDict,
 )
-from alto2txt2fixture.utils import load_multiple_json
+from alto2txt2fixture.utils import console, load_json, load_multiple_json, logger
 
 MODULE_PATH: Path = Path().absolute()
 
 BADGE_PATH: Path = Path("docs") / "img" / "coverage.svg"
+COVERAGE_DATA_PATH: Final[Path] = Path(".coverage")
+
+OPTIONAL_TEST_MARKERS: Final[dict[str, str]] = {
+    "slow": "--runslow",
+    "download": "--rundownload",
+}
+
+ADJ_RUN_COMPLETE_MARKER: Final[str] = ".run_complete"
+ADJ_RUN_LOCK: Final[str] = ".run.lock"
+ADJ_RUN_CACHE_DIR: Final[str] = "adjacent_tables"
+ADJ_DOWNLOAD_CACHE_DIR: Final[str] = "adjacent_cache"
+ADJ_DOWNLOAD_CACHE_KEY: Final[str] = "alto2txt2fixture/downloads_sha256"
+REFRESH_DOWNLOADS_OPTION: Final[str] = "--refresh-downloads"
+DOWNLOAD_XDIST_GROUP: Final[str] = "download"
+DOWNLOAD_CONNECTION_TIMEOUT: Final[float] = 3.0
 
 LWM_PLAINTEXT_FIXTURE_FOLDER: Final[Path] = Path("bl_lwm")
 LWM_PLAINTEXT_FIXTURE: Final[Path] = (
@@ -44,49 +80,201 @@ LWM_PLAINTEXT_FIXTURE: Final[Path] = (
 #     return HMD_PLAINTEXT_FIXTURE
 
 
-# @pytest.fixture
-# def uncached_folder(monkeypatch, tmp_path) -> None:
-#     """Change local path to avoid using pre-cached data."""
-#     monkeypatch.chdir(tmp_path)
-#
-#
+@pytest.fixture
+def uncached_folder(tmp_path) -> Generator[Path, None, None]:
+    """Change local path to avoid using pre-cached data."""
+    with chdir(tmp_path):
+        yield tmp_path
+
+
 # @pytest.fixture(autouse=True)
 # def package_path(monkeypatch) -> None:
 #     monkeypatch.chdir(MODULE_PATH)
 
 
 @pytest.fixture(scope="session")
-def adj_test_path(tmp_path_factory) -> Path:
-    """Temp path for `adjacent_data_run_results` files."""
-    return tmp_path_factory.mktemp(OUTPUT.name)
+def adj_test_path(pytestconfig, tmp_path_factory) -> Path:
+    """`pytest` cache path for `adjacent_data_run_results` kept across sessions.
+
+    Note:
+        Falls back to a `tmp_path_factory` path if `cacheprovider` is disabled.
+    """
+    cache = getattr(pytestconfig, "cache", None)
+    if cache is None:
+        return tmp_path_factory.mktemp(ADJ_RUN_CACHE_DIR, numbered=False)
+    return cache.mkdir(ADJ_RUN_CACHE_DIR)
 
 
-@pytest.mark.downloaded
 @pytest.fixture(scope="session")
-def adjacent_data_run_results(adj_test_path: Path) -> Generator[PathLike, None, None]:
+def adj_cache_path(pytestconfig, tmp_path_factory) -> Path:
+    """`pytest` cache path for `downloaded_data_files` kept across sessions.
+
+    Note:
+        Falls back to a `tmp_path_factory` path if `cacheprovider` is disabled.
+    """
+    cache = getattr(pytestconfig, "cache", None)
+    if cache is None:
+        return tmp_path_factory.mktemp(ADJ_DOWNLOAD_CACHE_DIR, numbered=False)
+    return cache.mkdir(ADJ_DOWNLOAD_CACHE_DIR)
+
+
+def _remote_files_sha256(files_dict: RemoteDataFilesType) -> str:
+    """Return a `sha256` hex digest of `files_dict` names and `remote` urls."""
+    return sha256(
+        "\n".join(
+            f"{name}={config['remote']}" for name, config in sorted(files_dict.items())
+        ).encode()
+    ).hexdigest()
+
+
+def _run_source_sha256() -> str:
+    """Return a `sha256` hex digest of the `create_adjacent_tables` source."""
+    return sha256(Path(create_adjacent_tables.__file__).read_bytes()).hexdigest()
+
+
+def _remote_host_port(url: str) -> tuple[str, int]:
+    """Return `url` host and port, defaulting the port from its scheme."""
+    parsed = urlparse(url)
+    return (
+        str(parsed.hostname),
+        parsed.port or (443 if parsed.scheme == "https" else 80),
+    )
+
+
+def _unreachable_hosts(files_dict: RemoteDataFilesType) -> list[str]:
+    """Return `host:port` of `files_dict` `remote` urls that fail to connect."""
+    unreachable: list[str] = []
+    for host, port in sorted(
+        {_remote_host_port(config["remote"]) for config in files_dict.values()}
+    ):
+        try:
+            create_connection((host, port), timeout=DOWNLOAD_CONNECTION_TIMEOUT).close()
+        except OSError:
+            unreachable.append(f"{host}:{port}")
+    return unreachable
+
+
+@pytest.fixture(scope="session")
+def downloaded_data_files(adj_cache_path: Path, pytestconfig) -> RemoteDataFilesType:
+    """Return `FILES` config with `local` paths downloaded to `adj_cache_path`.
+
+    Note:
+        `download_data` is only called if `ADJ_DOWNLOAD_CACHE_KEY` in the
+        `pytest` cache does not match the `sha256` of `FILES` `remote` urls
+        or any `local` files are missing, for example after running with
+        `REFRESH_DOWNLOADS_OPTION` or if `FILES` urls change. A `FileLock`
+        ensures only one `pytest-xdist` worker downloads. If a download is
+        needed and any `remote` host is unreachable, dependent tests are
+        skipped once for the session rather than erroring. Without the
+        `cacheprovider` plugin files are always downloaded.
+    """
+    cache = getattr(pytestconfig, "cache", None)
+    files_dict: RemoteDataFilesType = {
+        name: RemoteDataSourceType(
+            remote=config["remote"], local=adj_cache_path / config["local"].name
+        )
+        for name, config in FILES.items()
+    }
+    files_sha256: str = _remote_files_sha256(files_dict)
+    with FileLock(adj_cache_path / ADJ_RUN_LOCK):
+        is_cached: bool = (
+            cache is not None
+            and cache.get(ADJ_DOWNLOAD_CACHE_KEY, None) == files_sha256
+        )
+        if not is_cached or not all(
+            config["local"].is_file() for config in files_dict.values()
+        ):
+            unreachable_hosts: list[str] = _unreachable_hosts(files_dict)
+            if unreachable_hosts:
+                pytest.skip(f"cannot reach {unreachable_hosts} to download data")
+            download_data(files_dict, overwrite=not is_cached)
+            if cache is not None:
+                cache.set(ADJ_DOWNLOAD_CACHE_KEY, files_sha256)
+    return files_dict
+
+
+@pytest.fixture(scope="session")
+def adjacent_data_run_results(
+    adj_test_path: Path, downloaded_data_files: RemoteDataFilesType
+) -> Generator[PathLike, None, None]:
     """Test `create_adjacent_tables.run`, using `cached` data if available.
 
     This fixture provides the results of `create_adjacent_tables.run` for tests
     to compare with. Include it as a parameter for tests that need those
     files downloaded locally to run.
+
+    Note:
+        `run` is skipped if `ADJ_RUN_COMPLETE_MARKER` in `adj_test_path`
+        contains the `sha256` of the current `create_adjacent_tables` source
+        and is newer than all `downloaded_data_files`. A
+        `FileLock` on `ADJ_RUN_LOCK` ensures only one `pytest-xdist` worker
+        calls `run` while others wait for its results.
     """
-    run(output_path=adj_test_path)
+    marker: Path = adj_test_path / ADJ_RUN_COMPLETE_MARKER
+    source_sha256: str = _run_source_sha256()
+    with FileLock(adj_test_path / ADJ_RUN_LOCK):
+        if not (
+            marker.is_file()
+            and marker.read_text() == source_sha256
+            and all(
+                config["local"].stat().st_mtime <= marker.stat().st_mtime
+                for config in downloaded_data_files.values()
+            )
+        ):
+            run(files_dict=deepcopy(downloaded_data_files), output_path=adj_test_path)
+            marker.write_text(source_sha256)
     yield adj_test_path
 
 
-@pytest.mark.downloaded
 @pytest.fixture(scope="session")
 def all_create_adjacent_tables_json_results(
     adjacent_data_run_results,
 ) -> Generator[list, None, None]:
-    """Return a list of `json` results from `adjacent_data_run_results`."""
-    yield load_multiple_json(adjacent_data_run_results)
+    """Return a list of `json` results from `adjacent_data_run_results`.
+
+    Note:
+        Loads `COMBINED_JSONL_FILENAME` if available, otherwise each `json`
+        file. Results are shared across a session, so do not modify.
+    """
+    yield load_multiple_json(
+        adjacent_data_run_results, jsonl_name=COMBINED_JSONL_FILENAME
+    )
 
 
-@pytest.fixture
-def bl_lwm(tmp_path) -> Generator[Path, None, None]:
-    yield copytree(LWM_PLAINTEXT_FIXTURE, tmp_path / LWM_PLAINTEXT_FIXTURE_FOLDER)
-    rmtree(tmp_path / LWM_PLAINTEXT_FIXTURE_FOLDER)
+@pytest.fixture(scope="session")
+def adjacent_tables_json_loaders(
+    adjacent_data_run_results: Path,
+) -> dict[str, Callable[[], list]]:
+    """Return lazy loaders for each `adjacent_data_run_results` `json` file.
+
+    Keys are `django` model names (e.g. `mitchells.entry`) and each loader
+    only reads and parses its `json` file when first called.
+
+    Example:
+        ```python
+        mitchells_entries: list = adjacent_tables_json_loaders["mitchells.entry"]()
+        ```
+    """
+    return {
+        Path(paths["json"]).stem.lower(): lru_cache(maxsize=1)(
+            partial(load_json, adjacent_data_run_results / paths["json"])
+        )
+        for paths in ALL_OUT_FILENAMES.values()
+    }
+
+
+@pytest.fixture(scope="session")
+def bl_lwm(tmp_path_factory) -> Path:
+    """Copy of `LWM_PLAINTEXT_FIXTURE` shared across a test session.
+
+    Note:
+        Tests should write outputs to `tmp_path` rather than within this path.
+    """
+    return copytree(
+        LWM_PLAINTEXT_FIXTURE,
+        tmp_path_factory.mktemp(str(LWM_PLAINTEXT_FIXTURE_FOLDER), numbered=False),
+        dirs_exist_ok=True,
+    )
 
 
 @pytest.fixture
@@ -106,17 +294,56 @@ def bl_lwm_plaintext_extracted(
     yield bl_lwm_plaintext
 
 
+@pytest.fixture(scope="session")
+def bl_lwm_plaintext_json_export_snapshot(tmp_path_factory) -> PlainTextFixture:
+    """Extract and export `bl_lwm` `json` fixtures once per test session.
+
+    Note:
+        Extraction runs on a separate copy of `LWM_PLAINTEXT_FIXTURE` with
+        `console` and `tqdm` output captured, so results are the same regardless of
+        which test first requests it. Do not modify; see
+        `bl_lwm_plaintext_json_export` for a per-test copy.
+    """
+    source_path: Path = copytree(
+        LWM_PLAINTEXT_FIXTURE,
+        tmp_path_factory.mktemp("lwm_plaintext_source", numbered=False),
+        dirs_exist_ok=True,
+    )
+    export_path: Path = tmp_path_factory.mktemp("lwm_plaintext", numbered=False)
+    with console.capture(), redirect_stdout(StringIO()):
+        plaintext_fixture: PlainTextFixture = PlainTextFixture(
+            path=source_path, data_provider_code="bl_lwm"
+        )
+        plaintext_fixture.extract_compressed()
+        plaintext_fixture.export_to_json_fixtures(output_path=export_path)
+    return plaintext_fixture
+
+
 @pytest.fixture
 def bl_lwm_plaintext_json_export(
-    bl_lwm_plaintext_extracted,
-    tmp_path,
+    bl_lwm_plaintext_json_export_snapshot: PlainTextFixture,
+    tmp_path: Path,
 ) -> Generator[PlainTextFixture, None, None]:
-    bl_lwm_plaintext_extracted.export_to_json_fixtures(output_path=tmp_path)
-    yield bl_lwm_plaintext_extracted
+    """Copy `bl_lwm_plaintext_json_export_snapshot` and its `json` to `tmp_path`.
 
+    Note:
+        The copy keeps the snapshot's extracted `path`, so its attributes match
+        the `path` and `compressed_path` fields of its exported `json`.
+    """
+    plaintext_fixture: PlainTextFixture = deepcopy(
+        bl_lwm_plaintext_json_export_snapshot
+    )
+    copytree(plaintext_fixture.export_directory, tmp_path, dirs_exist_ok=True)
+    with console.capture():
+        plaintext_fixture.set_exported_json_paths(
+            export_directory=tmp_path, saved_fixture_prefix=None, overwrite=True
+        )
+    yield plaintext_fixture
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def first_lwm_plaintext_json_dict(bl_lwm) -> PlaintextFixtureDict:
+    """Expected first `bl_lwm` record, shared across a session. Do not modify."""
     return PlaintextFixtureDict(
         pk=DEFAULT_INITIAL_PK,
         model=FULLTEXT_DJANGO_MODEL,
@@ -131,12 +358,13 @@ def first_lwm_plaintext_json_dict(bl_lwm) -> PlaintextFixtureDict:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def win_root_shadow_path() -> PureWindowsPath:
+    """Immutable `PureWindowsPath` shared across a session."""
     return PureWindowsPath("S:\\\\Standing\\in\\the\\shadows\\of\\love.")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def correct_win_path_trunc_str() -> str:
     """Correct truncated `str` for `win_root_shadow_path`."""
     return "S:\\Standing\\*\\*\\*\\*\\love."
@@ -154,19 +382,64 @@ def is_platform_darwin() -> bool:
     return sys.platform.startswith("darwin")
 
 
+@pytest.fixture(scope="session")
+def tmp_json_fixtures_template(tmp_path_factory) -> Path:
+    """Return a session path of test `json` fixtures to copy from."""
+    template_path: Path = tmp_path_factory.mktemp("json_fixtures_template")
+    for i in range(5):
+        (template_path / f"test_fixture-{i}.txt").write_text(json.dumps({"id": i}))
+    return template_path
+
+
 @pytest.fixture()
-def tmp_json_fixtures(tmp_path: Path) -> Generator[tuple[Path, ...], None, None]:
-    """Return a `tuple` of test `json` fixture paths."""
+def tmp_json_fixtures(
+    tmp_path: Path, tmp_json_fixtures_template: Path
+) -> Generator[tuple[Path, ...], None, None]:
+    """Return a `tuple` of test `json` fixture paths copied to `tmp_path`."""
+    copytree(tmp_json_fixtures_template, tmp_path, dirs_exist_ok=True)
     test_paths: tuple[Path, ...] = tuple(
         tmp_path / f"test_fixture-{i}.txt" for i in range(5)
     )
-    for i, path in enumerate(test_paths):
-        path.write_text(json.dumps({"id": i}))
     yield test_paths
     for path in test_paths:
         path.unlink()
 
 
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """Return a `CliRunner` shared across a test session.
+
+    Note:
+        This is a `click` `CliRunner` to invoke `cli_command` with, avoiding
+        `typer.testing.CliRunner` rebuilding the `click` `Command` from `cli`
+        on each `invoke`.
+    """
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def cli_command() -> Command:
+    """Return the `click` `Command` generated from `cli` once per session."""
+    return get_command(cli)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def wide_console() -> Generator[None, None, None]:
+    """Widen `console` to avoid wrapping `tmp_path_factory` paths in logs."""
+    original_width: int = console.width
+    console.width = 200
+    yield
+    console.width = original_width
+
+
+@pytest.fixture(autouse=True)
+def reset_logger_level() -> Generator[None, None, None]:
+    """Restore `logger` level after each test, for example after `cli` calls."""
+    original_level: int = logger.level
+    yield
+    logger.setLevel(original_level)
+
+
 @pytest.fixture(autouse=True)
 def doctest_auto_fixtures(
     doctest_namespace: dict, is_platform_win: bool, is_platform_darwin: bool
@@ -181,8 +454,70 @@ def doctest_auto_fixtures(
     doctest_namespace["WARNING"] = WARNING
 
 
+def pytest_addoption(parser) -> None:
+    """Add options to run tests with `OPTIONAL_TEST_MARKERS`."""
+    for marker, option in OPTIONAL_TEST_MARKERS.items():
+        parser.addoption(
+            option,
+            action="store_true",
+            default=False,
+            help=f"run tests marked `{marker}`",
+        )
+    parser.addoption(
+        REFRESH_DOWNLOADS_OPTION,
+        action="store_true",
+        default=False,
+        help="re-download files cached for tests marked `download`",
+    )
+
+
+def pytest_sessionstart(session) -> None:
+    """Clear `ADJ_DOWNLOAD_CACHE_KEY` if run with `REFRESH_DOWNLOADS_OPTION`.
+
+    Note:
+        This is skipped in `pytest-xdist` workers so the first worker to
+        need `downloaded_data_files` downloads them once for all workers.
+    """
+    cache = getattr(session.config, "cache", None)
+    if cache is None or hasattr(session.config, "workerinput"):
+        return
+    if session.config.getoption(REFRESH_DOWNLOADS_OPTION):
+        cache.set(ADJ_DOWNLOAD_CACHE_KEY, None)
+
+
+def pytest_collection_modifyitems(config, items) -> None:
+    """Skip tests with `OPTIONAL_TEST_MARKERS` unless their option is set.
+
+    Note:
+        If `pytest-xdist` is available, `download` tests are added to
+        `DOWNLOAD_XDIST_GROUP` so with `--dist loadgroup` they run on one
+        worker, sharing its session `downloaded_data_files` and
+        `adjacent_data_run_results`.
+    """
+    for marker, option in OPTIONAL_TEST_MARKERS.items():
+        if config.getoption(option):
+            continue
+        skip_marker = pytest.mark.skip(reason=f"need {option} option to run")
+        for item in items:
+            if marker in item.keywords:
+                item.add_marker(skip_marker)
+    if config.pluginmanager.hasplugin("xdist"):
+        for item in items:
+            if "download" in item.keywords:
+                item.add_marker(pytest.mark.xdist_group(DOWNLOAD_XDIST_GROUP))
+
+
 def pytest_sessionfinish(session, exitstatus):
-    """Generate badges for docs after tests finish."""
-    if exitstatus == 0:
-        BADGE_PATH.parent.mkdir(parents=True, exist_ok=True)
-        gen_cov_badge(["-o", f"{BADGE_PATH}", "-f"])
+    """Generate badges for docs after tests finish with coverage."""
+    if exitstatus != 0:
+        return
+    if not session.config.pluginmanager.hasplugin("_cov"):
+        return
+    if session.config.getoption("--no-cov", default=False):
+        return
+    if not session.config.getoption("--cov", default=None):
+        return
+    if not COVERAGE_DATA_PATH.exists():
+        return
+    BADGE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    gen_cov_badge(["-o", f"{BADGE_PATH}", "-f"])
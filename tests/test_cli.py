@@ -1,41 +1,75 @@
 import json
 from os.path import sep
 from pathlib import Path
-from sys import platform, stdout
+from sys import platform
 
 import pytest
-from typer.testing import CliRunner
+from click import Command
+from click.testing import CliRunner
 
-from alto2txt2fixture.cli import COMPRESSED_PATH_DEFAULT, cli, rename
+from alto2txt2fixture.cli import COMPRESSED_PATH_DEFAULT, plaintext, rename
 from alto2txt2fixture.types import FixtureDict
 from alto2txt2fixture.utils import rename_by_0_padding
 
-runner = CliRunner()
-
 
 @pytest.mark.slow
-def test_plaintext_cli(bl_lwm, first_lwm_plaintext_json_dict) -> None:
-    """Test running `plaintext` file export via `cli`."""
-    result = runner.invoke(
-        cli,
-        [
-            "plaintext",
-            str(bl_lwm),
-            "--save-path",
-            bl_lwm / "test-cli-plaintext-fixture",
-            "--data-provider-code",
-            "bl_lwm",
-            "--initial-pk",
-            5,
-        ],
+@pytest.mark.parametrize("use_cli_runner", (True, False))
+def test_plaintext_cli(
+    bl_lwm,
+    first_lwm_plaintext_json_dict,
+    tmp_path,
+    capsys,
+    runner: CliRunner,
+    cli_command: Command,
+    use_cli_runner: bool,
+) -> None:
+    """Test running `plaintext` file export via `cli` or calling `plaintext`."""
+    stdout: str
+    if use_cli_runner:
+        result = runner.invoke(
+            cli_command,
+            [
+                "plaintext",
+                str(bl_lwm),
+                "--save-path",
+                tmp_path / "test-cli-plaintext-fixture",
+                "--data-provider-code",
+                "bl_lwm",
+                "--initial-pk",
+                5,
+                "--extract-path",
+                str(tmp_path / "extracted"),
+            ],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0
+        stdout = result.stdout
+    else:
+        plaintext(
+            bl_lwm,
+            save_path=tmp_path / "test-cli-plaintext-fixture",
+            data_provider_code="bl_lwm",
+            initial_pk=5,
+            extract_path=tmp_path / "extracted",
+        )
+        stdout = capsys.readouterr().out
+    missing_messages: list[str] = [
+        message
+        for message in ("Extract path:", "bl_lwm", "extracted")
+        if message not in stdout
+    ]
+    assert not missing_messages, missing_messages
+    expected_path: str = str(
+        tmp_path
+        / Path(first_lwm_plaintext_json_dict["fields"]["path"]).relative_to(bl_lwm)
+    )
+    expected_compressed_path: str = str(
+        first_lwm_plaintext_json_dict["fields"]["compressed_path"]
     )
-    assert result.exit_code == 0
-    for message in ("Extract path:", "bl_lwm", "extracted"):
-        assert message in result.stdout
     exported_json: list[FixtureDict] = json.loads(
         (
-            bl_lwm / "test-cli-plaintext-fixture" / "plaintext_fixture-000001.json"
-        ).read_text()
+            tmp_path / "test-cli-plaintext-fixture" / "plaintext_fixture-000001.json"
+        ).read_bytes()
     )
     assert exported_json[0]["model"] == "fulltext.fulltext"
     assert exported_json[0]["pk"] == 5
@@ -45,27 +79,23 @@ def test_plaintext_cli(bl_lwm, first_lwm_plaintext_json_dict) -> None:
             exported_json[0]["fields"]["text"]
             == first_lwm_plaintext_json_dict["fields"]["text"]
         )
-    assert exported_json[0]["fields"]["path"] == str(
-        first_lwm_plaintext_json_dict["fields"]["path"]
-    )
-    assert exported_json[0]["fields"]["compressed_path"] == str(
-        first_lwm_plaintext_json_dict["fields"]["compressed_path"]
-    )
-    assert (
-        exported_json[0]["fields"]["updated_at"]
-        == exported_json[0]["fields"]["updated_at"]
-    )
+    assert exported_json[0]["fields"]["path"] == expected_path
+    assert exported_json[0]["fields"]["compressed_path"] == expected_compressed_path
+    assert isinstance(exported_json[0]["fields"]["updated_at"], str)
 
 
-def test_plaintext_cli_empty_path(bl_lwm) -> None:
+def test_plaintext_cli_empty_path(
+    bl_lwm, runner: CliRunner, cli_command: Command
+) -> None:
     """Test running `plaintext` file export via `cli`."""
     result = runner.invoke(
-        cli,
+        cli_command,
         [
             "plaintext",
             str(bl_lwm / ".."),
         ],
         input="y\n..\nn\n",
+        catch_exceptions=False,
     )
     assert result.exit_code == 0
     assert "'..'" in result.stdout
@@ -83,13 +113,15 @@ def test_plaintext_cli_empty_path(bl_lwm) -> None:
 def test_rename_cli(
     tmp_json_fixtures: tuple[Path, ...],
     tmp_path: Path,
+    runner: CliRunner,
+    cli_command: Command,
     run_type: str,
     input: str,
 ) -> None:
     """Test running `rename` via `cli`."""
     output_path: Path = tmp_path / "padded-file-names"
     result = runner.invoke(
-        cli,
+        cli_command,
         [
             "rename",
             str(tmp_path),
@@ -101,12 +133,15 @@ def test_rename_cli(
             run_type,
         ],
         input=input,
+        catch_exceptions=False,
     )
     assert result.exit_code == 0
     assert "Current" in result.stdout
     assert "New" in result.stdout
-    for path in tmp_json_fixtures:
-        assert str(path.name) in result.stdout
+    missing_names: list[str] = [
+        path.name for path in tmp_json_fixtures if path.name not in result.stdout
+    ]
+    assert not missing_names, missing_names
     if run_type == "--dry-run" and "n" not in input:
         assert not output_path.is_dir()
     if run_type == "--no-dry-run" or "y" in input:
@@ -136,11 +171,16 @@ def test_rename_compress(
         "compress_folder",
         "compressed",
     )
-    for text in info_txts:
-        assert text in stdout
-    for path in tmp_json_fixtures:
-        assert path.name in stdout
-        assert path.name + ".zip" in stdout
+    missing_texts: list[str] = [
+        text
+        for text in (
+            *info_txts,
+            *(path.name for path in tmp_json_fixtures),
+            *(path.name + ".zip" for path in tmp_json_fixtures),
+        )
+        if text not in stdout
+    ]
+    assert not missing_texts, missing_texts
     for path in tmp_json_fixtures:
         zip_path: Path = path.parent / COMPRESSED_PATH_DEFAULT / (path.name + ".zip")
         assert zip_path.is_file()
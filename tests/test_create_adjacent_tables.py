@@ -1,20 +1,20 @@
+from os import scandir
 from pathlib import Path
+from typing import Callable
 
 import pytest
 from _pytest.capture import CaptureResult
-from pandas import DataFrame, read_csv
+from pandas import DataFrame, Series, json_normalize, read_csv
 
 from alto2txt2fixture.create_adjacent_tables import (
-    FILES,
-    GAZETTEER_OUT_FILENAMES,
+    ALL_OUT_FILENAMES,
     ISSUE,
     MITCHELLS_OUT_FILENAMES,
     RemoteDataFilesType,
-    TableOutputConfigType,
     csv2json_list,
     download_data,
 )
-from alto2txt2fixture.utils import filter_json_fields, load_json
+from alto2txt2fixture.utils import load_json
 
 
 @pytest.fixture()
@@ -45,18 +45,29 @@ def test_download_custom_folder(test_admin_counties_config, capsys) -> None:
     assert "100%" in captured.out
 
 
+@pytest.mark.slow
+@pytest.mark.download
+def test_download(downloaded_data_files: RemoteDataFilesType) -> None:
+    """Assuming intenet connectivity, test downloading needed files."""
+    for data_paths in downloaded_data_files.values():
+        assert data_paths["local"].is_file()
+
+
 @pytest.mark.slow
 @pytest.mark.download
 def test_local_result_paths(adjacent_data_run_results) -> None:
     """Test `Mitchells` and `Gazetteer` `json` and `csv` results."""
-    for data_paths in FILES.values():
-        assert data_paths["local"].is_file()
-    all_outfiles: TableOutputConfigType = (
-        MITCHELLS_OUT_FILENAMES | GAZETTEER_OUT_FILENAMES
-    )
-    for paths_dict in all_outfiles.values():
-        assert Path(adjacent_data_run_results / paths_dict["csv"]).is_file()
-        assert Path(adjacent_data_run_results / paths_dict["json"]).is_file()
+    with scandir(adjacent_data_run_results) as entries:
+        present_file_names: set[str] = {
+            entry.name for entry in entries if entry.is_file()
+        }
+    missing_file_names: list[str] = [
+        file_name
+        for paths_dict in ALL_OUT_FILENAMES.values()
+        for file_name in (paths_dict["csv"], paths_dict["json"])
+        if file_name not in present_file_names
+    ]
+    assert not missing_file_names, missing_file_names
 
 
 @pytest.mark.download
@@ -66,32 +77,65 @@ def test_csv2json_list(adjacent_data_run_results) -> None:
     mitchells_issue_csv_path: Path = (
         adjacent_data_run_results / MITCHELLS_OUT_FILENAMES[ISSUE]["csv"]
     )
-    mitchells_issue_df: DataFrame = read_csv(mitchells_issue_csv_path)
+    mitchells_issue_row_count: int = sum(
+        len(chunk)
+        for chunk in read_csv(mitchells_issue_csv_path, chunksize=50_000, usecols=[0])
+    )
     mitchells_out: list = csv2json_list(
         mitchells_issue_csv_path, output_path=test_mitchells_write_folder
     )
-    mitchells_json: dict = load_json(
+    mitchells_json: list = load_json(
         test_mitchells_write_folder / MITCHELLS_OUT_FILENAMES[ISSUE]["json"]
     )
-    assert len(mitchells_issue_df) == len(mitchells_out)
+    assert mitchells_issue_row_count == len(mitchells_out)
     assert mitchells_json == mitchells_out
 
 
+def test_csv2json_list_local(tmp_path: Path) -> None:
+    """Test `csv2json_list` `pk`, `field` values and types without downloads."""
+    csv_path: Path = tmp_path / "Price.csv"
+    csv_path.write_text(
+        "pk,label,count,price,prices\n" '1,penny,2,3.5,"[1, 2]"\n' "2,,4,,[]\n"
+    )
+    numeric_csv_path: Path = tmp_path / "Issue.csv"
+    numeric_csv_path.write_text("pk,count,price\n1,2,3.5\n2,4,\n")
+    json_list: list = csv2json_list(csv_path, output_path=tmp_path)
+    numeric_json_list: list = csv2json_list(numeric_csv_path, output_path=tmp_path)
+    assert json_list == [
+        {
+            "pk": 1,
+            "model": "price",
+            "fields": {"label": "penny", "count": 2, "price": 3.5, "prices": [1, 2]},
+        },
+        {
+            "pk": 2,
+            "model": "price",
+            "fields": {"label": None, "count": 4, "price": None, "prices": []},
+        },
+    ]
+    assert numeric_json_list == [
+        {"pk": 1, "model": "issue", "fields": {"count": 2, "price": 3.5}},
+        {"pk": 2, "model": "issue", "fields": {"count": 4, "price": None}},
+    ]
+    # `==` treats 2 and 2.0 as equal, so check `int` columns are not upcast
+    assert [
+        (type(record["pk"]), type(record["fields"]["count"]))
+        for record in json_list + numeric_json_list
+    ] == [(int, int)] * 4
+    assert load_json(tmp_path / "Issue.json") == numeric_json_list
+    assert '"count": 2,' in (tmp_path / "Issue.json").read_text()
+
+
 @pytest.mark.download
 def test_mitchells_entry_15_newspaper_field(
-    all_create_adjacent_tables_json_results: list,
+    adjacent_tables_json_loaders: dict[str, Callable[[], list]],
 ) -> None:
     """Test `Mitchells` `Entry` 15 `json` and `csv` results.
 
-    The `all_create_adjacent_tables_json_results` fixture should provide a `list` of results in a
-    consistent order using `load_multiple_json`. Ideally this is as a `dict`
-    rather than a list for indexing but for now assuming the list order will
-    be consistent.
-
     Note:
         This is to verify correct results necessary to close issue #11
     """
-    mitchells_entry_15: dict = all_create_adjacent_tables_json_results[4][15]
+    mitchells_entry_15: dict = adjacent_tables_json_loaders["mitchells.entry"]()[15]
     assert mitchells_entry_15["model"] == "mitchells.entry"
     assert mitchells_entry_15["fields"]["title"].startswith("LLOYD'S WEEKLY")
     assert mitchells_entry_15["fields"]["newspaper"] == 1187
@@ -99,21 +143,25 @@ def test_mitchells_entry_15_newspaper_field(
 
 @pytest.mark.download
 def test_mitchells_empty_newspaper_field(
-    all_create_adjacent_tables_json_results: list,
+    adjacent_tables_json_loaders: dict[str, Callable[[], list]],
 ) -> None:
     """Test if any `Mitchells` `Entry` has an empty `Newspaper` field."""
-    empty_newspaper_records: list | dict = filter_json_fields(
-        all_create_adjacent_tables_json_results[4], fields=("newspaper",), value=""
+    mitchells_entries: DataFrame = json_normalize(
+        adjacent_tables_json_loaders["mitchells.entry"]()
     )
+    empty_newspaper: Series = mitchells_entries["fields.newspaper"] == ""
     # This originally failed in 878 cases
-    assert len(empty_newspaper_records) == 0
+    assert not empty_newspaper.any(), mitchells_entries.loc[empty_newspaper, "pk"]
 
 
 @pytest.mark.download
-def test_correct_gazetteer_null(all_create_adjacent_tables_json_results: list) -> None:
+def test_correct_gazetteer_null(
+    adjacent_tables_json_loaders: dict[str, Callable[[], list]],
+) -> None:
     """Test fixinging `Gazetteer` `AdminCounty` references."""
-    empty_gazetteer_place_records: list | dict = filter_json_fields(
-        all_create_adjacent_tables_json_results[3], fields=("admin_county",), value=""
+    gazetteer_places: DataFrame = json_normalize(
+        adjacent_tables_json_loaders["gazetteer.place"]()
     )
+    empty_admin_county: Series = gazetteer_places["fields.admin_county"] == ""
     # This originally failed in 1075 (all but 1) case(s)
-    assert len(empty_gazetteer_place_records) == 0
+    assert not empty_admin_county.any(), gazetteer_places.loc[empty_admin_county, "pk"]
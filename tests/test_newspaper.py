@@ -1,27 +1,41 @@
+from io import StringIO
+from typing import Final
+
 import pytest
 from _pytest.capture import CaptureResult
+from rich.console import Console
 
 from alto2txt2fixture.__main__ import run
+from alto2txt2fixture.cli import show_fixture_tables, show_setup
+from alto2txt2fixture.settings import settings
 
+COLLECTIONS_CONFIG_SNIPPET: Final[str] = "COLLECTIONS │ ['hmd', 'lwm', 'jisc', 'bna'] │"
+FIXTURE_CONFIG_SNIPPET: Final[str] = "bl_hmd │ hmd"
 
-@pytest.mark.parametrize(
-    "test_config_param, msg_included",
-    [("--show-fixture-tables", True), ("--no-show-fixture-tables", False)],
-)
-def test_newspaper_show_tables(
-    test_config_param: str,
-    msg_included: bool,
-    capsys: pytest.LogCaptureFixture,
-) -> None:
-    """Test using `test_config` to only print out run config."""
-    collections_config_snippet: str = "COLLECTIONS │ ['hmd', 'lwm', 'jisc', 'bna'] │"
-    fixture_config_snipit: str = "bl_hmd │ hmd"
+
+@pytest.fixture(scope="module")
+def setup_and_fixture_tables_output() -> str:
+    """Render `show_setup` and `show_fixture_tables` once per module."""
+    output_console: Console = Console(file=StringIO(), width=200)
+    show_setup(clear=False, console=output_console, COLLECTIONS=settings.COLLECTIONS)
+    show_fixture_tables(settings, console=output_console)
+    return output_console.file.getvalue()
+
+
+def test_show_setup_and_fixture_tables(setup_and_fixture_tables_output: str) -> None:
+    """Test `run` config and fixture tables printed by default."""
+    assert COLLECTIONS_CONFIG_SNIPPET in setup_and_fixture_tables_output
+    assert FIXTURE_CONFIG_SNIPPET in setup_and_fixture_tables_output
+
+
+def test_newspaper_no_show_tables(capsys: pytest.LogCaptureFixture) -> None:
+    """Test `--no-show-fixture-tables` only prints out run config."""
     with pytest.raises(SystemExit) as e_info:
-        run([test_config_param])
+        run(["--no-show-fixture-tables"])
     assert e_info.traceback[1].path.name == "__main__.py"
     captured: CaptureResult = capsys.readouterr()
-    assert collections_config_snippet in captured.out
-    assert (fixture_config_snipit in captured.out) == msg_included
+    assert COLLECTIONS_CONFIG_SNIPPET in captured.out
+    assert FIXTURE_CONFIG_SNIPPET not in captured.out
 
 
 @pytest.mark.parametrize("help_param", ("-h", "--help"))
@@ -65,3 +79,4 @@ def test_run_without_local_or_blobfuse(
     assert e_info.traceback[1].path.name == "__main__.py"
     captured: CaptureResult = capsys.readouterr()
     assert error_message in captured.out
+    assert FIXTURE_CONFIG_SNIPPET in captured.out
@@ -1,40 +1,36 @@
 from logging import DEBUG
 from pathlib import Path, PureWindowsPath
-from zipfile import ZipFile, ZipInfo
+from typing import Final
+from zipfile import ZipFile
 
 import pytest
 
-from alto2txt2fixture.create_adjacent_tables import (
-    GAZETTEER_OUT_FILENAMES,
-    MITCHELLS_OUT_FILENAMES,
-    TableOutputConfigType,
-    download_data,
-)
+from alto2txt2fixture.create_adjacent_tables import ALL_OUT_FILENAMES
 from alto2txt2fixture.plaintext import PlainTextFixture
 from alto2txt2fixture.utils import (
     ArchiveFormatEnum,
     check_newspaper_collection_configuration,
     compress_fixture,
+    logger,
     truncate_path_str,
 )
 
+JSON_OUTFILE_STEMS: Final[tuple[str, ...]] = tuple(
+    json_outfile_name.rpartition(".")[0]
+    for json_outfile_name in sorted(
+        result["json"].lower() for result in ALL_OUT_FILENAMES.values()
+    )
+)
+
 
 @pytest.mark.download
 def test_json_results_ordering(all_create_adjacent_tables_json_results: list) -> None:
     """Test the ordering of `all_create_adjacent_tables_json_results`."""
-    json_outfile_names: TableOutputConfigType = sorted(
-        result["json"].lower()
-        for result in (MITCHELLS_OUT_FILENAMES | GAZETTEER_OUT_FILENAMES).values()
+    models: tuple[str, ...] = tuple(
+        json_fixture[0]["model"]
+        for json_fixture in all_create_adjacent_tables_json_results
     )
-    for i, json_fixture in enumerate(all_create_adjacent_tables_json_results):
-        assert json_fixture[0]["model"] == Path(json_outfile_names[i]).stem
-
-
-@pytest.mark.slow
-@pytest.mark.download
-def test_download() -> None:
-    """Assuming intenet connectivity, test downloading needed files."""
-    download_data()
+    assert models == JSON_OUTFILE_STEMS
 
 
 def test_check_newspaper_collection_config(capsys) -> None:
@@ -43,12 +39,15 @@ def test_check_newspaper_collection_config(capsys) -> None:
         "Warning: 2 `collections` not in `newspaper_collections`: {"
     )
     unmatched: set[str] = check_newspaper_collection_configuration(["cat", "dog"])
+    stdout: str = capsys.readouterr().out
     assert unmatched == {"cat", "dog"}
-    assert correct_log_prefix in capsys.readouterr().out
+    assert correct_log_prefix in stdout
 
 
 @pytest.mark.parametrize(
-    "head_parts, tail_parts", ((500, 0), (0, 500), (-1, 50), (50, -1))
+    "head_parts, tail_parts",
+    ((500, 0), (0, 500), (-1, 50), (50, -1)),
+    ids=("head-too-long", "tail-too-long", "negative-head", "negative-tail"),
 )
 def test_bad_head_tail_logging(
     head_parts: int,
@@ -57,6 +56,7 @@ def test_bad_head_tail_logging(
     caplog,
 ) -> None:
     """Test invalid indexing options."""
+    caplog.set_level(DEBUG, logger=logger.name)
     test_result: str = truncate_path_str(
         path=win_root_shadow_path,
         head_parts=head_parts,
@@ -66,25 +66,32 @@ def test_bad_head_tail_logging(
         max_length=10,
         _force_type=PureWindowsPath,
     )
-    assert PureWindowsPath(test_result) == win_root_shadow_path
+    win_path_str: str = str(win_root_shadow_path)
+    assert test_result == win_path_str
     if head_parts < 0 or tail_parts < 0:
         index_params_error_log: str = (
             "Both index params for `truncate_path_str` must be >=0: "
             f"(head_parts={head_parts}, tail_parts={tail_parts})"
         )
-        assert index_params_error_log in caplog.text
+        assert any(
+            message.startswith(index_params_error_log) for message in caplog.messages
+        )
     else:
         drive_or_absolute_log: str = (
             f"Adding 1 to `head_parts`: {head_parts} to truncate: "
-            f"'{str(win_root_shadow_path)[:10]}"
+            f"'{win_path_str[:10]}"
         )
         truncate_error_log: str = (
-            f"Returning untruncated. Params "
+            "Returning untruncated. Params "
             f"(head_parts={head_parts + 1}, tail_parts={tail_parts}) "
-            f"not valid to truncate: '{str(win_root_shadow_path)[:10]}"
+            f"not valid to truncate: '{win_path_str[:10]}"
+        )
+        assert any(
+            message.startswith(drive_or_absolute_log) for message in caplog.messages
+        )
+        assert any(
+            message.startswith(truncate_error_log) for message in caplog.messages
         )
-        assert drive_or_absolute_log in caplog.text
-        assert truncate_error_log in caplog.text
 
 
 def test_windows_root_path_truncate(
@@ -102,7 +109,9 @@ def test_windows_root_path_truncate(
 
 
 @pytest.mark.parametrize(
-    "compress_files_count, compress_type", ((1, "zip"), (2, "zip"), (1, "tar"))
+    "compress_files_count, compress_type",
+    ((1, "zip"), (2, "zip"), (1, "tar")),
+    ids=("one-file-zip", "two-files-zip", "one-file-tar"),
 )
 def test_compress_fixtures(
     tmp_path: Path,
@@ -174,11 +183,9 @@ def test_compress_fixtures(
         assert compressed_path.stem == str(multiple_files_path)
         assert not json_path.is_file()
     if compress_type == ArchiveFormatEnum.ZIP:
-        zipfile_info_list: list[ZipInfo] = ZipFile(compressed_path).infolist()
-        assert len(zipfile_info_list) == compress_files_count
+        with ZipFile(compressed_path) as zip_file:
+            zipfile_names: list[str] = zip_file.namelist()
+        assert len(zipfile_names) == compress_files_count
         json_file_index: int = 0 if compress_files_count == 1 else -1
         if not is_platform_win:  # compression ordering differes
-            assert (
-                Path(zipfile_info_list[json_file_index].filename).name
-                == uncompressed_json
-            )
+            assert Path(zipfile_names[json_file_index]).name == uncompressed_json